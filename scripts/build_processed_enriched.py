@@ -1,17 +1,28 @@
 """
 Build data/processed/ethiopia_fi_enriched.xlsx from raw data.
 Run from repo root: python scripts/build_processed_enriched.py
-Creates sheets: data, events, impact_links (with indicator_code, lag_months, etc.).
+Creates sheets: data, events, impact_links (with indicator_code, lag_months, etc.),
+plus a pickled snapshot of the three sheets for fast startup and memory-mappable
+model artifacts (trend coefficients, scenario forecast cube, event x indicator matrix)
+in data/processed/artifacts/.
 """
+import sys
 import pandas as pd
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+from src.data_loading import SNAPSHOT_PATH, build_snapshot
+from src.forecasting import save_forecast_artifacts
+from src.impact_model import build_event_indicator_matrix, merge_event_impacts, save_event_indicator_matrix
+from src.export import export_workbook, format_stats
 RAW_PATH = REPO_ROOT / "data" / "raw" / "ethiopia_fi_unified_data.xlsx"
 OUT_PATH = REPO_ROOT / "data" / "processed" / "ethiopia_fi_enriched.xlsx"
+FORECAST_YEARS = [2025, 2026, 2027]
 
 
-def main():
+def main(out_path=OUT_PATH):
+    out_path = Path(out_path)
     # Load raw: first sheet usually has main data; Impact_sheet may have impact_links
     xls = pd.ExcelFile(RAW_PATH)
     frames = [pd.read_excel(xls, s) for s in xls.sheet_names]
@@ -73,12 +84,25 @@ def main():
         if c not in impact_links_out.columns:
             impact_links_out[c] = None
 
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(OUT_PATH, engine="openpyxl") as w:
-        data.to_excel(w, sheet_name="data", index=False)
-        events.to_excel(w, sheet_name="events", index=False)
-        impact_links_out[out_cols].to_excel(w, sheet_name="impact_links", index=False)
-    print(f"Written: {OUT_PATH}")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    stats = export_workbook(
+        {"data": data, "events": events, "impact_links": impact_links_out[out_cols]},
+        out_path,
+    )
+    print(f"Written: {format_stats(stats)}")
+    # Event index is built once here; duplicate IDs / dangling impact_links are warned about
+    payload = build_snapshot(str(out_path), str(out_path.with_name(Path(SNAPSHOT_PATH).name)))
+    print("Snapshot and event index refreshed (src.data_loading.load_snapshot)")
+
+    # Artifacts for the dashboard / downstream consumers (src.artifacts.open_artifacts)
+    data_enc, events_enc, links_enc = payload["frames"]
+    index = payload["event_index"]
+    artifacts_dir = out_path.parent / "artifacts"
+    codes = sorted(data_enc.loc[data_enc["record_type"] == "observation", "indicator_code"].dropna().astype(str).unique())
+    save_forecast_artifacts(data_enc, codes, FORECAST_YEARS, events_enc, links_enc, out_dir=artifacts_dir, index=index)
+    matrix = build_event_indicator_matrix(merge_event_impacts(events_enc, links_enc, index=index))
+    save_event_indicator_matrix(matrix, out_dir=artifacts_dir)
+    print(f"Artifacts written: {artifacts_dir}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+"""
+Quick forecast for one indicator from the command line.
+Run from repo root: python scripts/forecast.py ACC_OWNERSHIP [--years 2025 2026 2027] [--mode baseline|event|scenario]
+Reads the binary snapshot and its prebuilt event index (see src.data_loading.load_snapshot)
+instead of parsing Excel; pandas and the forecasting code are only imported after arguments are parsed.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("indicator", help="indicator_code, e.g. ACC_OWNERSHIP")
+    parser.add_argument("--years", type=int, nargs="+", default=[2025, 2026, 2027])
+    parser.add_argument("--mode", choices=["baseline", "event", "scenario"], default="event")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from src.data_loading import load_snapshot
+    from src.forecasting import baseline_trend_forecast, event_augmented_forecast, scenario_forecasts
+
+    data, events, impact_links, index = load_snapshot(with_index=True)
+    if args.mode == "baseline":
+        table = baseline_trend_forecast(data, args.indicator, args.years)
+    elif args.mode == "event":
+        table = event_augmented_forecast(data, args.indicator, args.years, events, impact_links, index=index)
+    else:
+        table = scenario_forecasts(data, args.indicator, args.years, events, impact_links, index=index)
+    print(table.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Profile the unified dataset in one streaming pass and write a data-quality report.
+Run from repo root: python scripts/profile_data.py [--input PATH] [--format md|json] [--output PATH]
+Covers missingness (per column and record_type), indicator coverage, confidence distribution,
+temporal range, duplicate record_ids and orphan impact_links.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RAW_PATH = REPO_ROOT / "data" / "raw" / "ethiopia_fi_unified_data.xlsx"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", default=str(RAW_PATH), help="Unified dataset (.xlsx or .csv)")
+    parser.add_argument("--format", choices=["md", "json"], default="md")
+    parser.add_argument("--output", help="Output file (default: stdout)")
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from src.profiling import profile_dataset, profile_to_json, profile_to_markdown
+
+    profile = profile_dataset(args.input, chunksize=args.chunksize)
+    text = profile_to_markdown(profile) if args.format == "md" else profile_to_json(profile)
+    if args.output:
+        out = Path(args.output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(text, encoding="utf-8")
+        print(f"Written: {out}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
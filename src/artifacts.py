@@ -0,0 +1,110 @@
+"""
+Disk-persisted model outputs as memory-mappable NumPy arrays plus a JSON manifest.
+Each artifact is one .npy file; the manifest records its shape, dtype and axis labels,
+so consumers (e.g. the dashboard) can open arrays zero-copy with np.load(mmap_mode="r").
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / "data" / "processed" / "artifacts"
+
+
+def _labels(values) -> list:
+    """Axis labels as JSON-serializable scalars."""
+    out = []
+    for v in values:
+        if isinstance(v, np.generic):
+            v = v.item()
+        out.append(v if isinstance(v, (int, float, str)) or v is None else str(v))
+    return out
+
+
+def _read_manifest(out_dir: Path) -> dict:
+    path = out_dir / MANIFEST
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"version": 1, "artifacts": {}}
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _replace_atomically(path: Path, write) -> None:
+    """
+    Call write(file) on a temporary file in the same directory, then os.replace() it over `path`.
+    Readers holding a memmap of the old file keep the old inode and never see a partial write.
+    The file gets the usual umask-based mode rather than mkstemp's 0600, so other users can read it.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def save_array(name: str, array: np.ndarray, axes: dict, out_dir=DEFAULT_DIR) -> Path:
+    """
+    Write `array` to <out_dir>/<name>.npy and register it in the manifest.
+    `axes` maps axis name -> labels, in array dimension order.
+    Both files are replaced atomically, so open memmaps stay valid.
+    """
+    out_dir = Path(out_dir)
+    array = np.ascontiguousarray(array)
+    if len(axes) != array.ndim or any(len(l) != n for l, n in zip(axes.values(), array.shape)):
+        raise ValueError(f"{name}: axes {list(axes)} do not match array shape {array.shape}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{name}.npy"
+    _replace_atomically(path, lambda f: np.save(f, array, allow_pickle=False))
+    manifest = _read_manifest(out_dir)
+    manifest["artifacts"][name] = {
+        "file": path.name,
+        "dtype": str(array.dtype),
+        "shape": list(array.shape),
+        "axes": {k: _labels(v) for k, v in axes.items()},
+    }
+    text = json.dumps(manifest, indent=2).encode("utf-8")
+    _replace_atomically(out_dir / MANIFEST, lambda f: f.write(text))
+    return path
+
+
+def save_frame(name: str, df: pd.DataFrame, out_dir=DEFAULT_DIR) -> Path:
+    """Persist a numeric DataFrame (values as float64, index/columns as axis labels)."""
+    axes = {df.index.name or "index": df.index.tolist(), df.columns.name or "columns": df.columns.tolist()}
+    return save_array(name, df.to_numpy(dtype=float), axes, out_dir)
+
+
+def open_artifacts(out_dir=DEFAULT_DIR) -> dict:
+    """
+    Open every artifact listed in the manifest as a read-only memmap.
+    Returns {name: (array, axes)}; nothing is read until the arrays are indexed.
+    """
+    out_dir = Path(out_dir)
+    manifest = _read_manifest(out_dir)
+    if not manifest["artifacts"]:
+        raise FileNotFoundError(f"No artifacts manifest in {out_dir}")
+    return {
+        name: (np.load(out_dir / meta["file"], mmap_mode="r"), meta["axes"])
+        for name, meta in manifest["artifacts"].items()
+    }
+
+
+def load_frame(name: str, out_dir=DEFAULT_DIR) -> pd.DataFrame:
+    """Open a 2-D artifact as a DataFrame backed by the memmap (no copy)."""
+    array, axes = open_artifacts(out_dir)[name]
+    if array.ndim != 2:
+        raise ValueError(f"{name} has {array.ndim} dimensions; use open_artifacts for cubes")
+    (index_name, index), (columns_name, columns) = axes.items()
+    df = pd.DataFrame(array, index=pd.Index(index, name=index_name), columns=pd.Index(columns, name=columns_name), copy=False)
+    return df
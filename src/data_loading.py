@@ -1,6 +1,10 @@
+import pickle
 import pandas as pd
 from pathlib import Path
 
+SNAPSHOT_PATH = "data/processed/ethiopia_fi_snapshot.pkl"
+SNAPSHOT_VERSION = 3  # bump when the snapshot payload layout changes
+
 def load_unified_dataset(file_path: str) -> pd.DataFrame:
     """
     Load unified Ethiopia FI dataset from Excel or CSV.
@@ -50,6 +54,91 @@ def load_reference_codes(file_path: str) -> pd.DataFrame:
         raise ValueError("Unsupported reference file format")
 
 
+# Columns encoded against reference_codes.xlsx (reference field -> dataset columns)
+REFERENCE_ENCODED_FIELDS = {
+    "category": ["category"],
+    "impact_direction": ["impact_direction"],
+    "confidence": ["confidence"],
+}
+# Indicator codes are not listed in reference_codes; both columns share one dictionary
+INDICATOR_CODE_COLUMNS = ["indicator_code", "related_indicator"]
+# Spellings accepted by impact_model / build_processed_enriched besides the reference codes
+CODE_ALIASES = {
+    "impact_direction": ["positive", "negative", "neutral"],
+}
+
+
+def build_code_dictionary(reference_codes: pd.DataFrame, data: pd.DataFrame = None) -> dict:
+    """
+    Build {column: CategoricalDtype} from reference_codes (field/code rows).
+    reference_codes has no indicator list, so the indicator dictionary is taken from
+    data["indicator_code"] and shared by indicator_code and related_indicator. As a result
+    indicator_code itself can never fail validation; only related_indicator (and
+    indicator_code of frames not passed as `data`) is checked against it.
+    """
+    codes = {}
+    for field, columns in REFERENCE_ENCODED_FIELDS.items():
+        values = reference_codes.loc[reference_codes["field"] == field, "code"].dropna().astype(str).tolist()
+        values += [v for v in CODE_ALIASES.get(field, []) if v not in values]
+        dtype = pd.CategoricalDtype(values)
+        for col in columns:
+            codes[col] = dtype
+    if data is not None and "indicator_code" in data.columns:
+        indicators = sorted(data["indicator_code"].dropna().astype(str).unique())
+        dtype = pd.CategoricalDtype(indicators)
+        for col in INDICATOR_CODE_COLUMNS:
+            codes[col] = dtype
+    return codes
+
+
+def encode_reference_codes(df: pd.DataFrame, codes: dict, errors: str = "raise") -> pd.DataFrame:
+    """
+    Convert coded columns to categoricals using the dictionary from build_code_dictionary.
+    Values not in the dictionary raise ValueError (errors="raise") or become NaN (errors="coerce").
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError("errors must be 'raise' or 'coerce'")
+    df = df.copy()
+    unknown = {}
+    for col, dtype in codes.items():
+        if col not in df.columns:
+            continue
+        values = df[col].astype(object).where(df[col].notna())
+        text = values.where(values.isna(), values.astype(str))
+        known = text.isna() | text.isin(dtype.categories)
+        if not known.all():
+            unknown[col] = sorted(text[~known].unique())
+        df[col] = text.where(known).astype(dtype)
+    if unknown and errors == "raise":
+        raise ValueError("Unknown reference codes:\n" + "\n".join(f"{c}: {v}" for c, v in unknown.items()))
+    return df
+
+
+def load_encoded_dataset(
+    file_path: str = "data/raw/ethiopia_fi_unified_data.xlsx",
+    reference_path: str = "data/raw/reference_codes.xlsx",
+    errors: str = "raise",
+) -> pd.DataFrame:
+    """Load the unified dataset with coded columns encoded as shared categoricals."""
+    df = load_unified_dataset(str(_repo_path(file_path)))
+    codes = build_code_dictionary(load_reference_codes(str(_repo_path(reference_path))), df)
+    return encode_reference_codes(df, codes, errors=errors)
+
+
+def encode_processed_frames(frames, reference_path: str = "data/raw/reference_codes.xlsx", errors: str = "raise"):
+    """
+    Encode (data, events, impact_links) with one shared code dictionary, so indicator filters
+    in impact_model / forecasting compare integer category codes instead of strings.
+    Indicator codes come from the data and events sheets; impact_links are validated against them.
+    """
+    data, events, impact_links = frames
+    codes = build_code_dictionary(
+        load_reference_codes(str(_repo_path(reference_path))),
+        pd.concat([data, events], ignore_index=True),
+    )
+    return tuple(encode_reference_codes(df, codes, errors=errors) for df in (data, events, impact_links))
+
+
 def load_processed_enriched(file_path: str = "data/processed/ethiopia_fi_enriched.xlsx"):
     """
     Load the enriched dataset from processed Excel with sheets: data, events, impact_links.
@@ -64,3 +153,191 @@ def load_processed_enriched(file_path: str = "data/processed/ethiopia_fi_enriche
     events = pd.read_excel(path, sheet_name="events")
     impact_links = pd.read_excel(path, sheet_name="impact_links")
     return data, events, impact_links
+
+
+def iter_unified_chunks(file_path: str, columns=None, predicate=None, chunksize: int = 50_000):
+    """
+    Yield the unified dataset in chunks instead of one concatenated frame.
+    `columns` restricts what is read; `predicate(df) -> bool mask` is applied to
+    each chunk before it is yielded, so filtered-out rows never accumulate.
+    """
+    path = Path(file_path)
+
+    if path.suffix == ".xlsx":
+        for df in _iter_xlsx_chunks(path, columns, chunksize):
+            yield from _filtered_chunks(df, columns, predicate, chunksize)
+
+    elif path.suffix == ".csv":
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = None if columns is None else [c for c in columns if c in header]
+        for df in pd.read_csv(path, usecols=usecols, chunksize=chunksize):
+            yield from _filtered_chunks(df, columns, predicate, chunksize)
+
+    else:
+        raise ValueError("Unsupported file format")
+
+
+def unified_columns(file_path: str) -> list:
+    """Column names of the unified dataset (union of the sheet headers, in order) without reading any rows."""
+    path = Path(file_path)
+    if path.suffix == ".csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    if path.suffix != ".xlsx":
+        raise ValueError("Unsupported file format")
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        names = {}
+        for ws in wb.worksheets:
+            header = next(ws.iter_rows(values_only=True, max_row=1), None) or ()
+            names.update(dict.fromkeys(c for c in header if c is not None))
+    finally:
+        wb.close()
+    return list(names)
+
+
+def _iter_xlsx_chunks(path: Path, columns, chunksize: int):
+    """
+    Stream every sheet row by row (openpyxl read-only) so memory stays bounded by chunksize.
+    Each sheet is scanned twice: first for its column dtypes (_sheet_dtypes), then for the rows,
+    so every chunk of a sheet has the same dtypes however the rows are split.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                continue
+            # Sheets may not share every column (e.g. parent_id only on Impact_sheet)
+            keep = [i for i, c in enumerate(header) if c is not None and (columns is None or c in columns)]
+            names = [header[i] for i in keep]
+            dtypes = _sheet_dtypes(ws, keep, names)
+            buf = []
+            for row in rows:
+                if all(v is None for v in row):
+                    continue
+                buf.append([row[i] if i < len(row) else None for i in keep])
+                if len(buf) >= chunksize:
+                    yield pd.DataFrame(buf, columns=names).astype(dtypes)
+                    buf = []
+            if buf:
+                yield pd.DataFrame(buf, columns=names).astype(dtypes)
+    finally:
+        wb.close()
+
+
+def _sheet_dtypes(ws, keep: list, names: list) -> dict:
+    """dtype of each kept column over the whole sheet, inferred from one sample value per Python type."""
+    samples = [{} for _ in keep]
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if all(v is None for v in row):
+            continue
+        for sample, i in zip(samples, keep):
+            v = row[i] if i < len(row) else None
+            sample.setdefault(type(v), v)
+    return {
+        name: _typed_frame([[v] for v in sample.values()] or [[None]], [name]).dtypes[name]
+        for name, sample in zip(names, samples)
+    }
+
+
+def _typed_frame(rows: list, names: list) -> pd.DataFrame:
+    """Frame from raw openpyxl values with the dtypes pd.read_excel would infer (empty columns -> float64)."""
+    df = pd.DataFrame(rows, columns=names).infer_objects()
+    for col in df.columns[df.dtypes == object]:
+        if df[col].isna().all():
+            df[col] = df[col].astype("float64")
+        elif df[col].map(lambda v: v is None or isinstance(v, str)).all():
+            df[col] = df[col].astype("str")
+    return df
+
+
+def _filtered_chunks(df: pd.DataFrame, columns, predicate, chunksize: int):
+    """Align chunk to requested columns, apply predicate and split into chunks."""
+    if columns is not None:
+        df = df.reindex(columns=list(columns))
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        if predicate is not None:
+            chunk = chunk[predicate(chunk)]
+        if not chunk.empty:
+            yield chunk
+
+
+def _repo_path(file_path: str) -> Path:
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent / path
+    return path
+
+
+def build_snapshot(
+    file_path: str = "data/processed/ethiopia_fi_enriched.xlsx",
+    snapshot_path: str = SNAPSHOT_PATH,
+    reference_path: str = "data/raw/reference_codes.xlsx",
+):
+    """
+    Parse the processed workbook once, encode its coded columns (encode_processed_frames) and
+    pickle (data, events, impact_links) next to it, together with the EventIndex over events,
+    so CLI entry points can skip Excel parsing, re-encoding and re-indexing. Integrity problems (duplicate IDs, dangling links) are warned about here.
+    Returns the snapshot payload.
+    """
+    from src.event_index import build_event_index
+
+    source = _repo_path(file_path)
+    reference = _repo_path(reference_path)
+    frames = encode_processed_frames(load_processed_enriched(str(source)), reference_path=str(reference))
+    target = _repo_path(snapshot_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "source": str(source),
+        "source_mtime": source.stat().st_mtime,
+        "reference": str(reference),
+        "reference_mtime": reference.stat().st_mtime,
+        "frames": frames,
+        "event_index": build_event_index(frames[1], frames[2]),
+    }
+    with open(target, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return payload
+
+
+def _snapshot_input_changed(payload: dict, key: str, path: Path) -> bool:
+    """True when the snapshot was built from another file than `path`, or `path` changed since."""
+    return payload.get(key) != str(path) or (path.exists() and payload[f"{key}_mtime"] < path.stat().st_mtime)
+
+
+def load_snapshot(
+    snapshot_path: str = SNAPSHOT_PATH,
+    file_path: str = "data/processed/ethiopia_fi_enriched.xlsx",
+    with_index: bool = False,
+    reference_path: str = "data/raw/reference_codes.xlsx",
+):
+    """
+    Load the encoded (data, events, impact_links) from the binary snapshot; with_index=True
+    appends the prebuilt EventIndex, to be passed on to impact_model / forecasting functions.
+    The snapshot is rebuilt when missing, or when the processed workbook or the reference codes
+    it was encoded against are a different file or newer than the snapshot's copy.
+    """
+    target = _repo_path(snapshot_path)
+    source = _repo_path(file_path)
+    reference = _repo_path(reference_path)
+    payload = None
+    if target.exists():
+        with open(target, "rb") as f:
+            payload = pickle.load(f)
+        if (
+            payload.get("version") != SNAPSHOT_VERSION
+            or _snapshot_input_changed(payload, "source", source)
+            or _snapshot_input_changed(payload, "reference", reference)
+        ):
+            payload = None
+    if payload is None:
+        payload = build_snapshot(str(source), str(target), str(reference))
+    frames = payload["frames"]
+    return (*frames, payload["event_index"]) if with_index else frames
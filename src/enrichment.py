@@ -7,6 +7,7 @@ from pathlib import Path
 from datetime import datetime
 from src.data_loading import load_unified_dataset
 from src.schema_checks import validate_schema
+from src.export import export_csv
 
 
 def _base_row(columns: list) -> dict:
@@ -276,8 +277,7 @@ def execute_enrichment(
     df_enriched = pd.concat([df, df_new], ignore_index=True)
     validate_schema(df_enriched)
 
-    output_full.parent.mkdir(parents=True, exist_ok=True)
-    df_enriched.to_csv(output_full, index=False)
+    export_csv(df_enriched, output_full)
     return df_enriched
 
 
@@ -0,0 +1,150 @@
+"""
+Hash index over events: record_id -> row position.
+Built once when the data is loaded (see data_loading.build_snapshot); replaces the repeated impact_links -> events merges on
+parent_id and reports duplicate event IDs and dangling impact_links.
+
+EventCalendar answers "which effects are active at these dates and what is their cumulative
+impact" with binary search over sorted effect starts and prefix sums.
+"""
+import warnings
+import numpy as np
+import pandas as pd
+
+
+class EventIndex:
+    """
+    Index of an events DataFrame keyed by record_id.
+    Duplicate record_ids keep their first row; they are listed in `duplicate_ids`.
+    """
+
+    def __init__(self, events: pd.DataFrame):
+        self.events = events.reset_index(drop=True).copy()
+        if "period_start" in self.events.columns:
+            self.events["period_start"] = pd.to_datetime(self.events["period_start"], errors="coerce")
+        else:
+            self.events["period_start"] = pd.NaT
+
+        ids = self.events["record_id"] if "record_id" in self.events.columns else pd.Series(dtype=object)
+        self.duplicate_ids = sorted(ids[ids.duplicated() & ids.notna()].unique().tolist())
+        self.positions = {}
+        for pos, rid in enumerate(ids):
+            if pd.notna(rid) and rid not in self.positions:
+                self.positions[rid] = pos
+
+    def __len__(self):
+        return len(self.positions)
+
+    def locate(self, parent_ids) -> np.ndarray:
+        """Row positions for each parent_id; -1 where the event does not exist."""
+        return np.fromiter((self.positions.get(p, -1) for p in parent_ids), dtype=np.int64, count=len(parent_ids))
+
+    def take(self, parent_ids, column: str) -> pd.Series:
+        """Gather one event column for each parent_id (NaN/NaT for dangling links)."""
+        pos = self.locate(list(parent_ids))
+        found = pos >= 0
+        if self.events.empty:
+            return pd.Series([np.nan] * len(pos), dtype=object)
+        values = self.events[column].iloc[np.where(found, pos, 0)].reset_index(drop=True)
+        return values.where(found)
+
+    def gather(self, impacts: pd.DataFrame, columns, suffixes=("_impact", "_event")) -> pd.DataFrame:
+        """
+        Equivalent of a left merge impacts.parent_id -> events.record_id for `columns`,
+        using indexed lookups. Overlapping column names get `suffixes` like DataFrame.merge.
+        """
+        out = impacts.reset_index(drop=True)
+        overlap = [c for c in columns if c in out.columns]
+        out = out.rename(columns={c: c + suffixes[0] for c in overlap})
+        parents = out["parent_id"].tolist()
+        for c in columns:
+            name = c + suffixes[1] if c in overlap else c
+            out[name] = self.take(parents, c).values
+        return out
+
+    def dangling(self, impacts: pd.DataFrame) -> pd.DataFrame:
+        """impact_links whose parent_id has no matching event."""
+        return impacts[self.locate(impacts["parent_id"].tolist()) < 0]
+
+    def integrity_report(self, impacts: pd.DataFrame = None) -> list:
+        """Human-readable problems: duplicate event IDs and dangling impact_links."""
+        problems = []
+        if self.duplicate_ids:
+            problems.append(f"duplicate event record_ids: {self.duplicate_ids}")
+        if impacts is not None and "parent_id" in impacts.columns:
+            bad = self.dangling(impacts)
+            if not bad.empty:
+                problems.append(f"{len(bad)} impact_links with unknown parent_id: {sorted(map(str, bad['parent_id'].unique()))}")
+        return problems
+
+
+def build_event_index(events: pd.DataFrame, impacts: pd.DataFrame = None, warn: bool = True) -> EventIndex:
+    """Build an EventIndex and warn about duplicate IDs / dangling impact_links."""
+    index = EventIndex(events)
+    if warn:
+        for problem in index.integrity_report(impacts):
+            warnings.warn(problem, stacklevel=2)
+    return index
+
+
+class EventCalendar:
+    """
+    Event effects on one time axis (any numeric unit: days, years, ...).
+    Each effect ramps linearly from 0 at its start to its full size `duration` later and then
+    stays there (no decay). All effects share the duration, so sorting by start also sorts by
+    end: the effects active at t form one contiguous slice of the sorted arrays.
+    """
+
+    def __init__(self, starts, effects, duration: float, ids=None):
+        starts = np.asarray(starts, dtype=float)
+        effects = np.asarray(effects, dtype=float)
+        ids = np.asarray(ids if ids is not None else np.arange(len(starts)), dtype=object)
+        keep = ~np.isnan(starts) & ~np.isnan(effects)
+        order = np.argsort(starts[keep], kind="stable")
+        self.duration = float(duration)
+        self.starts = starts[keep][order]
+        self.ends = self.starts + self.duration
+        self.effects = effects[keep][order]
+        self.ids = ids[keep][order]
+        # Prefix sums of effect and effect * start, with a leading 0
+        self.cum_effect = np.concatenate([[0.0], np.cumsum(self.effects)])
+        self.cum_effect_start = np.concatenate([[0.0], np.cumsum(self.effects * self.starts)])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _bounds(self, times: np.ndarray):
+        started = np.searchsorted(self.starts, times, side="right")  # start <= t
+        finished = np.searchsorted(self.ends, times, side="right")  # end <= t
+        return started, finished
+
+    def cumulative_effect(self, times) -> np.ndarray:
+        """Sum of all effects at each time: full size once ended, (t - start) / duration while ramping."""
+        t = np.asarray(times, dtype=float)
+        started, finished = self._bounds(t)
+        ramp_effect = self.cum_effect[started] - self.cum_effect[finished]
+        ramp_effect_start = self.cum_effect_start[started] - self.cum_effect_start[finished]
+        return (t * ramp_effect - ramp_effect_start) / self.duration + self.cum_effect[finished]
+
+    def active_counts(self, times) -> np.ndarray:
+        """Number of effects still ramping (start <= t < end) at each time."""
+        started, finished = self._bounds(np.asarray(times, dtype=float))
+        return started - finished
+
+    def active(self, time) -> np.ndarray:
+        """ids of the effects ramping at `time`."""
+        started, finished = self._bounds(np.asarray([time], dtype=float))
+        return self.ids[finished[0]:started[0]]
+
+    def started(self, time) -> np.ndarray:
+        """ids of every effect that has begun by `time` (ramping or complete)."""
+        started, _ = self._bounds(np.asarray([time], dtype=float))
+        return self.ids[:started[0]]
+
+
+def to_days(dates) -> np.ndarray:
+    """Dates as float days since the epoch (NaT -> NaN), the time axis for day-based calendars."""
+    values = pd.to_datetime(pd.Series(dates), errors="coerce").values.astype("datetime64[D]")
+    days = values.astype("int64").astype(float)
+    days[np.isnat(values)] = np.nan
+    return days
+
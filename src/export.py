@@ -0,0 +1,95 @@
+"""
+Chunked, multi-threaded export of enriched outputs.
+Chunks are converted/formatted by a thread pool while the calling thread writes them in order,
+so only a bounded window of chunks is held in memory. Every exporter returns write statistics
+(rows, bytes, seconds, bytes_per_sec).
+"""
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def _chunks(df: pd.DataFrame, chunksize: int):
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def _ordered_map(pool, fn, items, window: int):
+    """Like pool.map but with at most `window` tasks in flight; results come back in input order."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _stats(path: Path, rows: int, started: float) -> dict:
+    seconds = time.perf_counter() - started
+    size = path.stat().st_size
+    return {
+        "path": str(path),
+        "rows": rows,
+        "bytes": size,
+        "seconds": round(seconds, 3),
+        "bytes_per_sec": round(size / seconds) if seconds > 0 else None,
+    }
+
+
+def _excel_rows(chunk: pd.DataFrame) -> list:
+    """Chunk as lists of Python values openpyxl can write (missing values -> None)."""
+    return chunk.astype(object).where(chunk.notna(), None).values.tolist()
+
+
+def export_workbook(sheets: dict, path, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 4) -> dict:
+    """
+    Write {sheet_name: DataFrame} to one .xlsx with openpyxl's write-only (streaming) mode.
+    Row conversion runs in a thread pool; rows are appended to each sheet in order.
+    """
+    from openpyxl import Workbook
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    wb = Workbook(write_only=True)
+    rows = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for name, df in sheets.items():
+            ws = wb.create_sheet(title=name)
+            ws.append([str(c) for c in df.columns])
+            for chunk_rows in _ordered_map(pool, _excel_rows, _chunks(df, chunksize), window=2 * workers):
+                for row in chunk_rows:
+                    ws.append(row)
+                rows += len(chunk_rows)
+    wb.save(path)
+    return _stats(path, rows, started)
+
+
+def export_csv(df: pd.DataFrame, path, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 4) -> dict:
+    """Write df as CSV; chunks are formatted to text in parallel and appended in order."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    def fmt(item):
+        first, chunk = item
+        return chunk.to_csv(None, index=False, header=first).encode("utf-8")
+
+    items = ((i == 0, chunk) for i, chunk in enumerate(_chunks(df, chunksize)))
+    with open(path, "wb") as f, ThreadPoolExecutor(max_workers=workers) as pool:
+        if df.empty:
+            f.write(df.to_csv(None, index=False).encode("utf-8"))
+        for block in _ordered_map(pool, fmt, items, window=2 * workers):
+            f.write(block)
+    return _stats(path, len(df), started)
+
+
+def format_stats(stats: dict) -> str:
+    rate = stats["bytes_per_sec"]
+    rate_txt = f"{rate / 1e6:.2f} MB/s" if rate else "n/a"
+    return f"{stats['path']}: {stats['rows']} rows, {stats['bytes'] / 1e6:.2f} MB in {stats['seconds']}s ({rate_txt})"
@@ -5,6 +5,7 @@ No ML models; linear regression only (appropriate for sparse, low-frequency data
 import pandas as pd
 import numpy as np
 from typing import Tuple, Optional
+from src.event_index import EventIndex, EventCalendar
 
 
 def _extract_series(obs: pd.DataFrame, indicator_code: str) -> Tuple[np.ndarray, np.ndarray]:
@@ -18,6 +19,15 @@ def _extract_series(obs: pd.DataFrame, indicator_code: str) -> Tuple[np.ndarray,
     return years, values
 
 
+def _fit_trend(years: np.ndarray, values: np.ndarray) -> Tuple[float, float, float]:
+    """OLS value = a + b * year. Returns (a, b, mse)."""
+    x = np.column_stack([np.ones_like(years), years])
+    beta, res, rank, s = np.linalg.lstsq(x, values, rcond=None)
+    a, b = beta[0], beta[1]
+    mse = ((values - (a + b * years)) ** 2).sum() / max(len(years) - 2, 1)
+    return a, b, mse
+
+
 def baseline_trend_forecast(
     obs: pd.DataFrame,
     indicator_code: str,
@@ -35,13 +45,9 @@ def baseline_trend_forecast(
         for y in forecast_years:
             out.append({"year": y, "forecast": point, "lower": point, "upper": point})
         return pd.DataFrame(out)
-    # OLS: value = a + b * year
-    x = np.column_stack([np.ones_like(years), years])
-    beta, res, rank, s = np.linalg.lstsq(x, values, rcond=None)
-    a, b = beta[0], beta[1]
+    a, b, mse = _fit_trend(years, values)
     n = len(years)
     y_mean = years.mean()
-    mse = ((values - (a + b * years)) ** 2).sum() / max(n - 2, 1)
     t_val = 1.96 if n <= 3 else min(2.0, 1.96 + 0.5 / (n - 2))  # approximate t for small n
     out = []
     for y in forecast_years:
@@ -53,19 +59,17 @@ def baseline_trend_forecast(
     return pd.DataFrame(out)
 
 
-def event_impact_additions(
-    forecast_years: list,
+def event_calendar(
     events: pd.DataFrame,
     impact_links: pd.DataFrame,
-    scale: float = 1.0,
     indicator_code: Optional[str] = None,
-) -> np.ndarray:
+    index: Optional[EventIndex] = None,
+) -> Optional[EventCalendar]:
     """
-    For each forecast year, compute cumulative event impact (sum of scaled effects).
-    If indicator_code is given, filter impact_links to that indicator.
+    EventCalendar (axis: calendar years, 3-year ramp) of the unscaled event effects on one indicator,
+    or on all indicators when indicator_code is None. None when there are no usable links.
+    Build it once and pass it to event_impact_additions to evaluate several scales / years.
     """
-    events = events.copy()
-    events["period_start"] = pd.to_datetime(events["period_start"], errors="coerce")
     impact_links = impact_links.copy()
     if indicator_code:
         if "indicator_code" in impact_links.columns:
@@ -77,15 +81,13 @@ def event_impact_additions(
         if mask.any():
             impact_links = impact_links[mask]
     if events.empty or impact_links.empty:
-        return np.zeros(len(forecast_years))
+        return None
     if "record_id" not in events.columns or "period_start" not in events.columns:
-        return np.zeros(len(forecast_years))
-    merged = impact_links.merge(
-        events[["record_id", "period_start"]],
-        left_on="parent_id",
-        right_on="record_id",
-        how="left",
-    )
+        return None
+    if index is None:
+        index = EventIndex(events)
+    merged = impact_links.copy()
+    merged["period_start"] = index.take(merged["parent_id"], "period_start").values
     # Magnitude: numeric or map low/medium/high
     mag_map = {"low": 0.5, "medium": 1.5, "high": 3.0}
     def num_mag(m):
@@ -93,24 +95,39 @@ def event_impact_additions(
         if isinstance(m, (int, float)): return float(m)
         return mag_map.get(str(m).lower(), 0.5)
     merged["mag"] = merged.get("impact_magnitude", pd.Series(dtype=float)).map(num_mag)
-    dir_sign = merged.get("impact_direction", pd.Series(dtype=object)).replace(
+    dir_sign = merged.get("impact_direction", pd.Series(dtype=object)).astype(object).replace(
         {"positive": 1, "increase": 1, "negative": -1, "decrease": -1}
     ).fillna(1)
     merged["sign"] = np.where(dir_sign.astype(str).str.lower().str.contains("neg|dec"), -1, 1)
-    merged["effect"] = merged["sign"] * merged["mag"] * scale
+    merged["effect"] = merged["sign"] * merged["mag"]
     merged["lag_months"] = pd.to_numeric(merged.get("lag_months", 0), errors="coerce").fillna(0)
-    additions = np.zeros(len(forecast_years))
-    for _, row in merged.iterrows():
-        start = row["period_start"]
-        if pd.isna(start):
-            continue
-        start_year = start.year + int(row["lag_months"] // 12)
-        effect_per_year = row["effect"] / 3.0  # spread over ~3 years
-        for i, y in enumerate(forecast_years):
-            if y >= start_year:
-                years_since = min(y - start_year + 1, 3)
-                additions[i] += effect_per_year * years_since
-    return additions
+    merged = merged.dropna(subset=["period_start"])
+    start_year = pd.to_datetime(merged["period_start"]).dt.year + (merged["lag_months"] // 12)
+    return EventCalendar(start_year, merged["effect"], duration=3, ids=merged["parent_id"])
+
+
+def event_impact_additions(
+    forecast_years: list,
+    events: pd.DataFrame,
+    impact_links: pd.DataFrame,
+    scale: float = 1.0,
+    indicator_code: Optional[str] = None,
+    index: Optional[EventIndex] = None,
+    calendar: Optional[EventCalendar] = None,
+) -> np.ndarray:
+    """
+    For each forecast year, compute cumulative event impact (sum of scaled effects).
+    Years are calendar years: fractional values are floored to the year they fall in.
+    If indicator_code is given, filter impact_links to that indicator.
+    Pass a prebuilt EventIndex to avoid re-indexing events on every call, or the indicator's
+    event_calendar() to skip filtering and sorting the links altogether.
+    """
+    if calendar is None:
+        calendar = event_calendar(events, impact_links, indicator_code, index)
+    if calendar is None:
+        return np.zeros(len(forecast_years))
+    # Effect spread over ~3 years: a full year after start_year counts 1/3, so evaluate at y + 1
+    return scale * calendar.cumulative_effect(np.floor(np.asarray(forecast_years, dtype=float)) + 1)
 
 
 def event_augmented_forecast(
@@ -121,10 +138,11 @@ def event_augmented_forecast(
     impact_links: pd.DataFrame,
     event_scale: float = 1.0,
     confidence: float = 0.95,
+    index: Optional[EventIndex] = None,
 ) -> pd.DataFrame:
     """Baseline trend plus cumulative event impacts. Returns forecast table with lower/upper."""
     base = baseline_trend_forecast(obs, indicator_code, forecast_years, confidence)
-    additions = event_impact_additions(forecast_years, events, impact_links, scale=event_scale, indicator_code=indicator_code)
+    additions = event_impact_additions(forecast_years, events, impact_links, scale=event_scale, indicator_code=indicator_code, index=index)
     base["forecast"] = base["forecast"] + additions
     base["lower"] = base["lower"] + additions * 0.8  # wider band
     base["upper"] = base["upper"] + additions * 1.2
@@ -137,22 +155,225 @@ def scenario_forecasts(
     forecast_years: list,
     events: pd.DataFrame,
     impact_links: pd.DataFrame,
+    index: Optional[EventIndex] = None,
 ) -> pd.DataFrame:
     """
     Three scenarios: pessimistic (low trend, low event effectiveness), base, optimistic.
     Returns long-format table: year, scenario, forecast, lower, upper.
     """
     base_trend = baseline_trend_forecast(obs, indicator_code, forecast_years, confidence=0.68)
+    # One calendar per indicator, reused for every year and scenario scale
+    calendar = event_calendar(events, impact_links, indicator_code, index)
     rows = []
     for i, y in enumerate(forecast_years):
         pt = base_trend.loc[base_trend["year"] == y, "forecast"].iloc[0]
         lo = base_trend.loc[base_trend["year"] == y, "lower"].iloc[0]
         hi = base_trend.loc[base_trend["year"] == y, "upper"].iloc[0]
-        add_pess = event_impact_additions([y], events, impact_links, scale=0.5, indicator_code=indicator_code)[0]
-        add_base = event_impact_additions([y], events, impact_links, scale=1.0, indicator_code=indicator_code)[0]
-        add_opt = event_impact_additions([y], events, impact_links, scale=1.5, indicator_code=indicator_code)[0]
+        add_pess = event_impact_additions([y], events, impact_links, scale=0.5, calendar=calendar)[0]
+        add_base = event_impact_additions([y], events, impact_links, scale=1.0, calendar=calendar)[0]
+        add_opt = event_impact_additions([y], events, impact_links, scale=1.5, calendar=calendar)[0]
         # Pessimistic: lower trend, low event effect
         rows.append({"indicator": indicator_code, "year": y, "scenario": "pessimistic", "forecast": pt * 0.95 + add_pess, "lower": lo * 0.9 + add_pess * 0.8, "upper": pt * 0.95 + add_pess * 1.2})
         rows.append({"indicator": indicator_code, "year": y, "scenario": "base", "forecast": pt + add_base, "lower": lo + add_base * 0.9, "upper": hi + add_base * 1.1})
         rows.append({"indicator": indicator_code, "year": y, "scenario": "optimistic", "forecast": pt * 1.05 + add_opt, "lower": pt * 1.02 + add_opt * 0.9, "upper": hi * 1.1 + add_opt * 1.2})
     return pd.DataFrame(rows)
+
+
+SCENARIOS = ["pessimistic", "base", "optimistic"]
+FORECAST_STATS = ["forecast", "lower", "upper"]
+
+
+def trend_coefficients(obs: pd.DataFrame, indicator_codes: list) -> pd.DataFrame:
+    """Fitted baseline trend per indicator: intercept, slope, mse, n_obs (NaN where < 2 points)."""
+    rows = []
+    for code in indicator_codes:
+        years, values = _extract_series(obs, code)
+        a, b, mse = _fit_trend(years, values) if len(years) >= 2 else (np.nan, np.nan, np.nan)
+        rows.append({"indicator": code, "intercept": a, "slope": b, "mse": mse, "n_obs": len(years)})
+    return pd.DataFrame(rows).set_index("indicator")
+
+
+def forecast_cube(
+    obs: pd.DataFrame,
+    indicator_codes: list,
+    forecast_years: list,
+    events: pd.DataFrame,
+    impact_links: pd.DataFrame,
+    index: Optional[EventIndex] = None,
+) -> Tuple[np.ndarray, dict]:
+    """
+    Scenario forecasts for several indicators as one array
+    [indicator, scenario, year, stat] with stat in (forecast, lower, upper).
+    Returns (cube, axes) where axes maps axis name -> labels.
+    """
+    if index is None:
+        index = EventIndex(events)
+    cube = np.full((len(indicator_codes), len(SCENARIOS), len(forecast_years), len(FORECAST_STATS)), np.nan)
+    for i, code in enumerate(indicator_codes):
+        table = scenario_forecasts(obs, code, forecast_years, events, impact_links, index=index)
+        for j, scenario in enumerate(SCENARIOS):
+            sub = table[table["scenario"] == scenario].set_index("year").reindex(forecast_years)
+            cube[i, j] = sub[FORECAST_STATS].to_numpy(dtype=float)
+    axes = {"indicator": list(indicator_codes), "scenario": SCENARIOS, "year": list(forecast_years), "stat": FORECAST_STATS}
+    return cube, axes
+
+
+def save_forecast_artifacts(
+    obs: pd.DataFrame,
+    indicator_codes: list,
+    forecast_years: list,
+    events: pd.DataFrame,
+    impact_links: pd.DataFrame,
+    out_dir=None,
+    index: Optional[EventIndex] = None,
+) -> None:
+    """Persist trend coefficients and the scenario forecast cube as memory-mappable artifacts."""
+    from src.artifacts import DEFAULT_DIR, save_array, save_frame
+
+    out_dir = out_dir or DEFAULT_DIR
+    save_frame("trend_coefficients", trend_coefficients(obs, indicator_codes).astype(float), out_dir)
+    cube, axes = forecast_cube(obs, indicator_codes, forecast_years, events, impact_links, index=index)
+    save_array("scenario_forecasts", cube, axes, out_dir)
+
+
+def _event_start_years(impact_links: pd.DataFrame, index: EventIndex) -> dict:
+    """Earliest effect start year per (event, indicator): event year + lag_months // 12."""
+    links = impact_links.copy()
+    if "indicator_code" not in links.columns:
+        links["indicator_code"] = links.get("related_indicator")
+    elif "related_indicator" in links.columns:
+        links["indicator_code"] = links["indicator_code"].astype(object).fillna(links["related_indicator"].astype(object))
+    links["period_start"] = index.take(links["parent_id"], "period_start").values
+    links["lag_months"] = pd.to_numeric(links.get("lag_months", 0), errors="coerce").fillna(0)
+    links = links.dropna(subset=["period_start", "indicator_code"])
+    starts = {}
+    for parent, code, start, lag in links[["parent_id", "indicator_code", "period_start", "lag_months"]].itertuples(index=False):
+        year = start.year + int(lag // 12)
+        key = (parent, code)
+        starts[key] = min(starts.get(key, year), year)
+    return starts
+
+
+def joint_trend_forecast(
+    obs: pd.DataFrame,
+    indicator_codes: list,
+    forecast_years: list,
+    events: pd.DataFrame,
+    impact_links: pd.DataFrame,
+    event_matrix: Optional[pd.DataFrame] = None,
+    event_prior_weight: float = 0.1,
+    index: Optional[EventIndex] = None,
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Fit all indicators together in one least-squares solve.
+    Design matrix: per-indicator intercept and slope (block diagonal) plus one column per event.
+    Indicators with a single observation get no slope column, so their trend is flat at that
+    value as in baseline_trend_forecast.
+    An event column holds event_matrix[event, indicator] * ramp(year), the same 3-year linear
+    ramp used by event_impact_additions, so each event gets one effect scale shared by every
+    indicator it touches. The scale is estimated from the data and shrunk towards 1 (the
+    low/medium/high prior) with weight event_prior_weight; sparse annual data cannot pin it down alone.
+    Each indicator's target is centred on its mean and divided by its mean |value| so large-unit
+    series do not dominate, which makes event_prior_weight comparable to a squared relative residual.
+    Years are centred per indicator and every design column is scaled to unit norm before the solve.
+
+    Returns (forecast table with indicator, year, forecast, lower, upper; event effect scales).
+    """
+    if index is None:
+        index = EventIndex(events)
+    if event_matrix is None:
+        from src.impact_model import build_event_indicator_matrix, merge_event_impacts
+        event_matrix = build_event_indicator_matrix(merge_event_impacts(events, impact_links, index=index))
+    starts = _event_start_years(impact_links, index)
+
+    series = {code: _extract_series(obs, code) for code in indicator_codes}
+    codes = [c for c in indicator_codes if len(series[c][0])]
+    event_ids = [e for e in event_matrix.index if any((e, c) in starts and c in event_matrix.columns for c in codes)]
+
+    def event_row(code, year):
+        """Event regressors for one indicator-year (prior magnitude x ramp)."""
+        x = np.zeros(len(event_ids))
+        for k, e in enumerate(event_ids):
+            start = starts.get((e, code))
+            if start is None or code not in event_matrix.columns:
+                continue
+            x[k] = event_matrix.at[e, code] * min(max(year - start + 1, 0), 3) / 3.0
+        return x
+
+    # Per-indicator normalisation: target (value - mean) / scale, slope regressor (year - mean year) / spread
+    means, scales, year_means, year_spreads, intercept_col, slope_col = {}, {}, {}, {}, {}, {}
+    n_trend = 0
+    for code in codes:
+        years, values = series[code]
+        means[code] = values.mean()
+        scales[code] = np.abs(values).mean() or 1.0
+        year_means[code] = years.mean()
+        year_spreads[code] = years.std() or 1.0
+        intercept_col[code] = n_trend
+        n_trend += 1
+        if len(years) >= 2:
+            slope_col[code] = n_trend
+            n_trend += 1
+    n_cols = n_trend + len(event_ids)
+
+    def trend_value(code, year, beta):
+        """Trend part of the forecast in the indicator's own units."""
+        z = beta[intercept_col[code]]
+        if code in slope_col:
+            z += beta[slope_col[code]] * (year - year_means[code]) / year_spreads[code]
+        return means[code] + scales[code] * z
+
+    # Assemble the sparse design as (row, col, value) triplets
+    rows, cols, vals, target, weight, owner = [], [], [], [], [], []
+    r = 0
+    for i, code in enumerate(codes):
+        years, values = series[code]
+        for y, v in zip(years, values):
+            ev = event_row(code, y) / scales[code]
+            nz = np.flatnonzero(ev)
+            rows += [r] + [r] * len(nz)
+            cols += [intercept_col[code]] + list(n_trend + nz)
+            vals += [1.0] + list(ev[nz])
+            if code in slope_col:
+                rows.append(r); cols.append(slope_col[code]); vals.append((y - year_means[code]) / year_spreads[code])
+            target.append((v - means[code]) / scales[code])
+            weight.append(1.0)
+            owner.append(i)
+            r += 1
+    n_data = r
+    # Prior: event scales towards 1
+    for k in range(len(event_ids)):
+        rows.append(r); cols.append(n_trend + k); vals.append(1.0)
+        target.append(1.0); weight.append(np.sqrt(event_prior_weight)); r += 1
+
+    design = np.zeros((r, n_cols))
+    np.add.at(design, (np.array(rows, dtype=int), np.array(cols, dtype=int)), vals)
+    w = np.array(weight)
+    weighted = design * w[:, None]
+    norms = np.linalg.norm(weighted, axis=0)
+    norms[norms == 0] = 1.0
+    beta, *_ = np.linalg.lstsq(weighted / norms, np.array(target) * w, rcond=None)
+    beta = beta / norms
+
+    owner = np.array(owner)
+    unit = np.array([scales[c] for c in codes])[owner] if n_data else np.zeros(0)
+    resid = (np.array(target[:n_data]) - design[:n_data] @ beta) * unit
+    effects = pd.Series(beta[n_trend:], index=pd.Index(event_ids, name="parent_id"), name="effect_scale")
+
+    out = []
+    for code in indicator_codes:
+        if code not in codes:
+            out += [{"indicator": code, "year": y, "forecast": np.nan, "lower": np.nan, "upper": np.nan} for y in forecast_years]
+            continue
+        j = codes.index(code)
+        years = series[code][0]
+        n = len(years)
+        mse = (resid[owner == j] ** 2).sum() / max(n - 2, 1)
+        y_mean = years.mean()
+        sxx = max(((years - y_mean) ** 2).sum(), 1e-6)
+        t_val = 1.96 if n <= 3 else min(2.0, 1.96 + 0.5 / (n - 2))
+        for y in forecast_years:
+            point = trend_value(code, y, beta) + event_row(code, y) @ beta[n_trend:]
+            half = t_val * np.sqrt(max(mse * (1 + 1 / n + (y - y_mean) ** 2 / sxx), 0)) if n >= 2 else 0.0
+            out.append({"indicator": code, "year": y, "forecast": float(point), "lower": float(point - half), "upper": float(point + half)})
+    return pd.DataFrame(out), effects
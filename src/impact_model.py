@@ -1,19 +1,18 @@
 import pandas as pd
+from src.event_index import EventIndex, EventCalendar, to_days
 #loader logic
 def load_events_and_impacts(df):
     events = df[df["record_type"] == "event"].copy()
     impacts = df[df["record_type"] == "impact_link"].copy()
     return events, impacts
 
-#join events - impact links
-def merge_event_impacts(events, impacts):
-    merged = impacts.merge(
-        events[
-            ["record_id", "category", "period_start", "source_name"]
-        ],
-        left_on="parent_id",
-        right_on="record_id",
-        how="left",
+#join events - impact links (indexed gather on parent_id -> record_id)
+def merge_event_impacts(events, impacts, index=None):
+    if index is None:
+        index = EventIndex(events)
+    merged = index.gather(
+        impacts,
+        ["record_id", "category", "period_start", "source_name"],
         suffixes=("_impact", "_event")
     )
     return merged
@@ -77,26 +76,14 @@ def apply_event_impacts_over_time(indicator_df, impact_links, duration_months=36
         impact_col = "impact_pp"
 
     monthly_effect = links.groupby(["period_start", "lag_months"])[impact_col].sum().reset_index()
-    monthly_effect["effect_start"] = monthly_effect.apply(
-        lambda r: r["period_start"] + pd.DateOffset(months=int(r["lag_months"])) if pd.notna(r["period_start"]) else pd.NaT,
-        axis=1,
-    )
-
-    def cumulative_impact(obs_date):
-        total = 0.0
-        for _, row in monthly_effect.iterrows():
-            start = row["effect_start"]
-            if pd.isna(start) or obs_date < start:
-                continue
-            months_elapsed = (obs_date - start).days / 30.44
-            if months_elapsed <= 0:
-                continue
-            # Linear accumulation: each month add (total_impact / duration_months)
-            add = row[impact_col] * min(months_elapsed / duration_months, 1.0)
-            total += add
-        return total
-
-    ind["impact_addition"] = ind["observation_date"].map(cumulative_impact)
+    effect_start = [
+        start + pd.DateOffset(months=int(lag)) if pd.notna(start) else pd.NaT
+        for start, lag in zip(monthly_effect["period_start"], monthly_effect["lag_months"])
+    ]
+
+    # Linear accumulation over duration_months (30.44 days each), looked up by binary search
+    calendar = EventCalendar(to_days(effect_start), monthly_effect[impact_col], duration_months * 30.44)
+    ind["impact_addition"] = calendar.cumulative_effect(to_days(ind["observation_date"]))
     ind["value_impacted"] = ind["value_numeric"] + ind["impact_addition"]
     return ind
 
@@ -176,3 +163,9 @@ def build_event_indicator_matrix(merged_df):
 
     return matrix
 
+
+def save_event_indicator_matrix(matrix, out_dir=None):
+    """Persist the Event x Indicator matrix as a memory-mappable artifact (see src.artifacts)."""
+    from src.artifacts import DEFAULT_DIR, save_frame
+
+    return save_frame("event_indicator_matrix", matrix, out_dir or DEFAULT_DIR)
@@ -0,0 +1,183 @@
+"""
+Streaming data-quality profile of the unified dataset.
+All metrics are accumulated chunk by chunk in one pass, so memory is bounded by the
+chunk size plus per-column / per-indicator counters (and the record_id set for duplicates).
+"""
+import json
+from collections import Counter, defaultdict
+import pandas as pd
+from src.data_loading import iter_unified_chunks
+
+
+class DataProfile:
+    """Accumulates data-quality counters over chunks; call update() per chunk, then to_dict()."""
+
+    def __init__(self):
+        self.rows = 0
+        self.rows_by_type = Counter()
+        self.non_null = Counter()
+        self.non_null_by_type = defaultdict(Counter)
+        self.columns = {}
+        self.indicator_counts = Counter()
+        self.indicator_first = {}
+        self.indicator_last = {}
+        self.confidence = defaultdict(Counter)
+        self.date_min = None
+        self.date_max = None
+        self.seen_ids = set()
+        self.duplicate_ids = Counter()
+        self.event_ids = set()
+        self.link_parents = defaultdict(list)
+        self.links_without_parent = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        n = len(chunk)
+        self.rows += n
+        self.columns.update(dict.fromkeys(chunk.columns))
+        record_type = chunk["record_type"].fillna("unknown") if "record_type" in chunk else pd.Series("unknown", index=chunk.index)
+        self.rows_by_type.update(record_type.value_counts().to_dict())
+
+        notna = chunk.notna()
+        self.non_null.update(notna.sum().to_dict())
+        for rt, counts in notna.groupby(record_type).sum().iterrows():
+            self.non_null_by_type[rt].update(counts.to_dict())
+
+        if "indicator_code" in chunk:
+            self._update_indicators(chunk)
+        if "confidence" in chunk:
+            for (rt, conf), c in chunk.groupby([record_type, chunk["confidence"]]).size().items():
+                self.confidence[rt][conf] += int(c)
+        if "observation_date" in chunk:
+            dates = pd.to_datetime(chunk["observation_date"], errors="coerce").dropna()
+            if not dates.empty:
+                lo, hi = dates.min(), dates.max()
+                self.date_min = lo if self.date_min is None else min(self.date_min, lo)
+                self.date_max = hi if self.date_max is None else max(self.date_max, hi)
+        if "record_id" in chunk:
+            self._update_ids(chunk, record_type)
+
+    def _update_indicators(self, chunk: pd.DataFrame) -> None:
+        codes = chunk["indicator_code"]
+        self.indicator_counts.update(codes.dropna().value_counts().to_dict())
+        if "observation_date" not in chunk:
+            return
+        dates = pd.to_datetime(chunk["observation_date"], errors="coerce")
+        span = dates.groupby(codes).agg(["min", "max"]).dropna()
+        for code, (lo, hi) in span.iterrows():
+            self.indicator_first[code] = min(self.indicator_first.get(code, lo), lo)
+            self.indicator_last[code] = max(self.indicator_last.get(code, hi), hi)
+
+    def _update_ids(self, chunk: pd.DataFrame, record_type: pd.Series) -> None:
+        for rid in chunk["record_id"].dropna():
+            if rid in self.seen_ids:
+                self.duplicate_ids[rid] += 1
+            else:
+                self.seen_ids.add(rid)
+        self.event_ids.update(chunk.loc[record_type == "event", "record_id"].dropna())
+        if "parent_id" in chunk:
+            links = chunk.loc[record_type == "impact_link", ["record_id", "parent_id"]]
+            for rid, parent in links.itertuples(index=False):
+                # NaN keys never compare equal, so null parents are kept in their own list
+                if pd.isna(parent):
+                    self.links_without_parent.append(rid)
+                else:
+                    self.link_parents[parent].append(rid)
+
+    def to_dict(self) -> dict:
+        """
+        Finalize the profile as plain JSON-serializable structures.
+        Keys are sorted (counts descending, then name) so the layout does not depend on chunk boundaries.
+        """
+        def pct(non_null, total):
+            return {c: round(100 * (1 - non_null.get(c, 0) / total), 2) if total else 0.0 for c in self.columns}
+
+        orphans = {
+            str(p): sorted(str(r) for r in rids)
+            for p, rids in sorted(self.link_parents.items(), key=lambda kv: str(kv[0]))
+            if p not in self.event_ids
+        }
+        record_types = sorted(self.rows_by_type)
+        return {
+            "rows": self.rows,
+            "record_type_counts": dict(_by_count(self.rows_by_type)),
+            "missing_pct": dict(sorted(pct(self.non_null, self.rows).items(), key=lambda kv: -kv[1])),
+            "missing_pct_by_record_type": {
+                rt: pct(self.non_null_by_type[rt], self.rows_by_type[rt]) for rt in record_types
+            },
+            "indicator_coverage": {
+                code: {
+                    "count": int(n),
+                    "first": _iso(self.indicator_first.get(code)),
+                    "last": _iso(self.indicator_last.get(code)),
+                }
+                for code, n in _by_count(self.indicator_counts)
+            },
+            "confidence_distribution": {
+                rt: dict(sorted(self.confidence[rt].items())) for rt in sorted(self.confidence)
+            },
+            "temporal_range": {"start": _iso(self.date_min), "end": _iso(self.date_max)},
+            "duplicate_record_ids": {str(k): v + 1 for k, v in sorted(self.duplicate_ids.items(), key=lambda kv: str(kv[0]))},
+            "orphan_impact_links": orphans,
+            "impact_links_without_parent_id": sorted(str(r) for r in self.links_without_parent),
+        }
+
+
+def _by_count(counter: Counter) -> list:
+    """(key, count) pairs, largest count first; ties broken by key."""
+    return sorted(counter.items(), key=lambda kv: (-kv[1], str(kv[0])))
+
+
+def _iso(ts):
+    return None if ts is None or pd.isna(ts) else pd.Timestamp(ts).date().isoformat()
+
+
+def profile_dataset(file_path: str, chunksize: int = 50_000) -> dict:
+    """Profile the unified dataset in a single chunked pass. Returns DataProfile.to_dict()."""
+    profile = DataProfile()
+    for chunk in iter_unified_chunks(file_path, chunksize=chunksize):
+        profile.update(chunk)
+    return profile.to_dict()
+
+
+def profile_to_json(profile: dict) -> str:
+    return json.dumps(profile, indent=2)
+
+
+def profile_to_markdown(profile: dict, title: str = "Data Quality Profile") -> str:
+    """Render a profile dict as a Markdown report (same sections as reports/data_quality_summary.md)."""
+    lines = [f"# {title}", "", f"**Total records:** {profile['rows']}", ""]
+
+    lines += ["## Record types", "", "| record_type | count |", "|---|---|"]
+    lines += [f"| {rt} | {n} |" for rt, n in profile["record_type_counts"].items()]
+
+    tr = profile["temporal_range"]
+    lines += ["", "## Temporal range", "", f"observation_date: {tr['start']} to {tr['end']}"]
+
+    lines += ["", "## Missing values (% per column)", ""]
+    types = list(profile["record_type_counts"])
+    lines += ["| column | all | " + " | ".join(types) + " |", "|---" * (len(types) + 2) + "|"]
+    by_type = profile["missing_pct_by_record_type"]
+    for col, p in profile["missing_pct"].items():
+        lines.append(f"| {col} | {p} | " + " | ".join(str(by_type[t][col]) for t in types) + " |")
+
+    lines += ["", "## Indicator coverage", "", "| indicator_code | count | first | last |", "|---|---|---|---|"]
+    for code, c in profile["indicator_coverage"].items():
+        lines.append(f"| {code} | {c['count']} | {c['first'] or ''} | {c['last'] or ''} |")
+
+    lines += ["", "## Confidence distribution", ""]
+    levels = sorted({lvl for c in profile["confidence_distribution"].values() for lvl in c})
+    lines += ["| record_type | " + " | ".join(levels) + " |", "|---" * (len(levels) + 1) + "|"]
+    for rt, c in profile["confidence_distribution"].items():
+        lines.append(f"| {rt} | " + " | ".join(str(c.get(lvl, 0)) for lvl in levels) + " |")
+
+    lines += ["", "## Referential integrity", ""]
+    dups = profile["duplicate_record_ids"]
+    lines.append(f"- Duplicate record_ids: {len(dups)}" + (f" ({', '.join(f'{k} x{v}' for k, v in dups.items())})" if dups else ""))
+    orphans = profile["orphan_impact_links"]
+    n_orphans = sum(len(v) for v in orphans.values())
+    lines.append(f"- Orphan impact_links (parent_id without event): {n_orphans}")
+    for parent, rids in orphans.items():
+        lines.append(f"  - {parent}: {', '.join(rids)}")
+    missing = profile["impact_links_without_parent_id"]
+    lines.append(f"- impact_links without parent_id: {len(missing)}" + (f" ({', '.join(missing)})" if missing else ""))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,181 @@
+"""
+Lazy query API over the unified dataset.
+Filter / select / groupby / aggregate steps are recorded and only executed on collect().
+Filters and column selections are pushed into the chunked loader, and several queries over
+the same source can be collected together so they share a single scan.
+"""
+import operator
+import pandas as pd
+from src.data_loading import iter_unified_chunks, unified_columns
+from src.data_quality import (
+    missing_value_summary,
+    record_type_distribution,
+    indicator_coverage,
+    confidence_distribution,
+)
+from src.exploration import temporal_range
+
+OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda s, v: s.isin(v),
+    "notna": lambda s, _: s.notna(),
+    "isna": lambda s, _: s.isna(),
+}
+
+
+class LazyQuery:
+    """
+    Immutable query plan over a dataset file (Excel or CSV).
+    Every builder method returns a new LazyQuery; nothing is read until collect().
+    """
+
+    def __init__(self, source, predicates=(), columns=None, group_keys=None, aggs=None, func=None):
+        self.source = str(source)
+        self.predicates = tuple(predicates)
+        self.columns = columns
+        self.group_keys = group_keys
+        self.aggs = aggs
+        self.func = func
+
+    def _replace(self, **changes):
+        params = {
+            "predicates": self.predicates,
+            "columns": self.columns,
+            "group_keys": self.group_keys,
+            "aggs": self.aggs,
+            "func": self.func,
+        }
+        params.update(changes)
+        return LazyQuery(self.source, **params)
+
+    def _check_open(self):
+        if self.aggs is not None or self.func is not None:
+            raise ValueError("Query already has a terminal step (agg/pipe)")
+
+    def filter(self, column: str, op: str, value=None) -> "LazyQuery":
+        """Keep rows where `column <op> value`; op is one of OPS."""
+        self._check_open()
+        if op not in OPS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        return self._replace(predicates=self.predicates + ((column, op, value),))
+
+    def select(self, *columns: str) -> "LazyQuery":
+        """Restrict the output (and the columns read from disk) to `columns`."""
+        self._check_open()
+        return self._replace(columns=tuple(columns))
+
+    def groupby(self, *keys: str) -> "LazyQuery":
+        """Group by `keys`; must be followed by agg()."""
+        self._check_open()
+        return self._replace(group_keys=tuple(keys))
+
+    def agg(self, **named) -> "LazyQuery":
+        """Named aggregations, e.g. agg(n=("record_id", "count")). Grouped if groupby() was called."""
+        self._check_open()
+        return self._replace(aggs=dict(named))
+
+    def pipe(self, func) -> "LazyQuery":
+        """Apply `func(df)` to the filtered frame as the terminal step."""
+        self._check_open()
+        if self.group_keys:
+            raise ValueError("groupby() must be followed by agg(), not pipe()")
+        return self._replace(func=func)
+
+    def required_columns(self):
+        """Columns that must be read from disk, or None when every column is needed."""
+        if self.columns is None and self.aggs is None:
+            return None
+        cols = list(self.columns or [])
+        cols += [c for c, _, _ in self.predicates]
+        cols += list(self.group_keys or [])
+        cols += [c for c, _ in (self.aggs or {}).values()]
+        return list(dict.fromkeys(cols))
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """Boolean mask for this query's predicates (all rows when there are none)."""
+        keep = pd.Series(True, index=df.index)
+        for column, op, value in self.predicates:
+            keep &= OPS[op](df[column], value).fillna(False).astype(bool)
+        return keep
+
+    def execute(self, df: pd.DataFrame):
+        """
+        Run the recorded plan on an already-loaded frame.
+        select() shapes the output of plain and pipe() queries; agg() defines its own output columns.
+        """
+        if self.group_keys and self.aggs is None:
+            raise ValueError("groupby() without agg(): add an aggregation step")
+        if self.predicates:
+            df = df[self.mask(df)]
+        if self.aggs is not None:
+            if self.group_keys:
+                return df.groupby(list(self.group_keys)).agg(**self.aggs)
+            return pd.Series({name: df[col].agg(how) for name, (col, how) in self.aggs.items()})
+        if self.columns is not None:
+            df = df[list(self.columns)]
+        if self.func is not None:
+            return self.func(df)
+        return df.reset_index(drop=True)
+
+    def collect(self):
+        return collect_all([self])[0]
+
+
+def scan(source) -> LazyQuery:
+    """Start a lazy query over a unified dataset file."""
+    return LazyQuery(source)
+
+
+def collect_all(queries):
+    """
+    Execute several queries, scanning each distinct source only once.
+    The union of required columns and the OR of the queries' predicates are pushed into the loader.
+    Returns results in the same order as `queries`.
+    """
+    queries = list(queries)
+    results = [None] * len(queries)
+    by_source = {}
+    for i, q in enumerate(queries):
+        by_source.setdefault(q.source, []).append(i)
+
+    for source, idx in by_source.items():
+        group = [queries[i] for i in idx]
+        needed = [q.required_columns() for q in group]
+        columns = None if any(c is None for c in needed) else list(dict.fromkeys(c for cols in needed for c in cols))
+        predicate = None
+        if all(q.predicates for q in group):
+            def predicate(df, group=group):
+                keep = pd.Series(False, index=df.index)
+                for q in group:
+                    keep |= q.mask(df)
+                return keep
+        chunks = list(iter_unified_chunks(source, columns=columns, predicate=predicate))
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            # Nothing matched: keep the source's columns so execute() can still filter/select on them
+            df = pd.DataFrame(columns=columns if columns is not None else unified_columns(source))
+        for i, q in zip(idx, group):
+            results[i] = q.execute(df)
+    return results
+
+
+def data_quality_report(source) -> dict:
+    """
+    Missingness, record types, indicator coverage, confidence and temporal range
+    of the dataset, computed from one scan. Returns {metric_name: result}.
+    """
+    base = scan(source)
+    queries = {
+        "missing_values": base.pipe(missing_value_summary),
+        "record_type_counts": base.select("record_type").pipe(record_type_distribution),
+        "indicator_coverage": base.select("indicator_code").pipe(indicator_coverage),
+        "confidence_distribution": base.select("record_type", "confidence").pipe(confidence_distribution),
+        "temporal_range": base.select("observation_date").pipe(temporal_range),
+    }
+    return dict(zip(queries, collect_all(queries.values())))
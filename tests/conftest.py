@@ -0,0 +1,35 @@
+import importlib.util
+import pytest
+from pathlib import Path
+from src.data_loading import load_processed_enriched, load_snapshot
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def processed_path(tmp_path_factory):
+    """Build the processed workbook (and snapshot) from raw data into a temp directory."""
+    spec = importlib.util.spec_from_file_location(
+        "build_processed_enriched", REPO_ROOT / "scripts" / "build_processed_enriched.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    out = tmp_path_factory.mktemp("processed") / "ethiopia_fi_enriched.xlsx"
+    module.main(out)
+    return out
+
+
+@pytest.fixture(scope="session")
+def processed(processed_path):
+    """Plain (data, events, impact_links) as read from the processed workbook."""
+    return load_processed_enriched(str(processed_path))
+
+
+@pytest.fixture(scope="session")
+def snapshot(processed_path):
+    """Encoded (data, events, impact_links, event_index) from the snapshot."""
+    return load_snapshot(
+        snapshot_path=str(processed_path.with_name("ethiopia_fi_snapshot.pkl")),
+        file_path=str(processed_path),
+        with_index=True,
+    )
@@ -0,0 +1,27 @@
+import os
+import stat
+import numpy as np
+from src.artifacts import load_frame, open_artifacts, save_array
+
+
+def test_resave_leaves_open_memmap_intact(tmp_path):
+    first = np.arange(12, dtype=float).reshape(3, 4)
+    axes = {"row": ["a", "b", "c"], "col": list("wxyz")}
+    save_array("m", first, axes, out_dir=tmp_path)
+    mapped, _ = open_artifacts(tmp_path)["m"]
+
+    save_array("m", np.zeros((5, 2)), {"row": list("abcde"), "col": ["u", "v"]}, out_dir=tmp_path)
+    np.testing.assert_array_equal(mapped, first)
+    assert load_frame("m", tmp_path).shape == (5, 2)
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
+    mask = os.umask(0)
+    os.umask(mask)
+    for name in ("m.npy", "manifest.json"):
+        assert stat.S_IMODE((tmp_path / name).stat().st_mode) == 0o666 & ~mask
+
+
+def test_build_writes_artifacts(processed_path):
+    artifacts = open_artifacts(processed_path.parent / "artifacts")
+    assert {"trend_coefficients", "scenario_forecasts", "event_indicator_matrix"} <= set(artifacts)
+    cube, axes = artifacts["scenario_forecasts"]
+    assert cube.shape == tuple(len(v) for v in axes.values())
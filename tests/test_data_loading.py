@@ -0,0 +1,47 @@
+import os
+import pickle
+import shutil
+import pandas as pd
+import pytest
+from pathlib import Path
+from src.data_loading import build_snapshot, iter_unified_chunks, load_snapshot, load_unified_dataset
+
+RAW = Path(__file__).resolve().parent.parent / "data" / "raw" / "ethiopia_fi_unified_data.xlsx"
+REFERENCE = RAW.with_name("reference_codes.xlsx")
+
+
+@pytest.mark.parametrize("chunksize", [50_000, 7])
+def test_streamed_chunks_match_full_load(chunksize):
+    full = load_unified_dataset(str(RAW))
+    streamed = pd.concat(list(iter_unified_chunks(str(RAW), chunksize=chunksize)), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, full)
+
+
+def _snapshot_payload(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def test_snapshot_rebuilt_for_another_workbook_or_reference(processed_path, tmp_path):
+    snapshot_path = tmp_path / "snapshot.pkl"
+    first = tmp_path / "first.xlsx"
+    second = tmp_path / "second.xlsx"
+    reference = tmp_path / "reference_codes.xlsx"
+    shutil.copy(processed_path, first)
+    shutil.copy(processed_path, second)
+    shutil.copy(REFERENCE, reference)
+    build_snapshot(str(first), str(snapshot_path), str(reference))
+    # second is older than the snapshot, so only the source path check can trigger a rebuild
+    old = snapshot_path.stat().st_mtime - 60
+    os.utime(second, (old, old))
+    os.utime(reference, (old, old))
+
+    load_snapshot(str(snapshot_path), str(second), reference_path=str(reference))
+    payload = _snapshot_payload(snapshot_path)
+    assert payload["source"] == str(second)
+
+    # Editing the reference codes makes the encoded frames stale
+    new = payload["reference_mtime"] + 60
+    os.utime(reference, (new, new))
+    load_snapshot(str(snapshot_path), str(second), reference_path=str(reference))
+    assert _snapshot_payload(snapshot_path)["reference_mtime"] == new
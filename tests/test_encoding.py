@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+from pathlib import Path
+from src.data_loading import (
+    build_code_dictionary,
+    encode_reference_codes,
+    load_encoded_dataset,
+    load_reference_codes,
+    load_unified_dataset,
+)
+from src.forecasting import scenario_forecasts
+
+RAW_DIR = Path(__file__).resolve().parent.parent / "data" / "raw"
+
+
+def test_load_encoded_dataset_from_another_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    df = load_encoded_dataset()
+    assert isinstance(df["confidence"].dtype, pd.CategoricalDtype)
+    assert df["indicator_code"].dtype == df["related_indicator"].dtype
+
+
+def test_unknown_codes_raise_or_coerce():
+    df = load_unified_dataset(str(RAW_DIR / "ethiopia_fi_unified_data.xlsx"))
+    codes = build_code_dictionary(load_reference_codes(str(RAW_DIR / "reference_codes.xlsx")), df)
+    df.loc[0, "confidence"] = "weird"
+    with pytest.raises(ValueError, match="confidence"):
+        encode_reference_codes(df, codes)
+    assert encode_reference_codes(df, codes, errors="coerce")["confidence"].isna().sum() == 1
+
+
+def test_snapshot_is_encoded_and_forecasts_unchanged(processed, snapshot):
+    data, events, impact_links, index = snapshot
+    assert isinstance(data["indicator_code"].dtype, pd.CategoricalDtype)
+    assert impact_links["indicator_code"].dtype == data["indicator_code"].dtype
+    years = [2025, 2026, 2027]
+    plain = scenario_forecasts(processed[0], "ACC_OWNERSHIP", years, processed[1], processed[2])
+    encoded = scenario_forecasts(data, "ACC_OWNERSHIP", years, events, impact_links, index=index)
+    pd.testing.assert_frame_equal(plain, encoded)
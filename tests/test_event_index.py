@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from src.event_index import EventCalendar, EventIndex
+from src.impact_model import merge_event_impacts
+
+
+def _frames():
+    events = pd.DataFrame({
+        "record_id": ["E1", "E2", "E1"],
+        "category": ["policy", "pricing", "milestone"],
+        "period_start": ["2021-05-01", "2023-08-01", None],
+        "source_name": ["NBE", "Safaricom", "dup"],
+    })
+    impacts = pd.DataFrame({"record_id": ["L1", "L2", "L3"], "parent_id": ["E2", "E9", "E1"]})
+    return events, impacts
+
+
+def test_gather_matches_left_merge_for_unique_ids():
+    events, impacts = _frames()
+    events = events.drop_duplicates("record_id")
+    expected = impacts.merge(
+        events, left_on="parent_id", right_on="record_id", how="left", suffixes=("_impact", "_event")
+    )
+    got = merge_event_impacts(events, impacts, index=EventIndex(events))
+    assert got["category"].fillna("-").tolist() == expected["category"].fillna("-").tolist()
+    assert got["record_id_event"].fillna("-").tolist() == expected["record_id_event"].fillna("-").tolist()
+
+
+def test_integrity_report_lists_duplicates_and_dangling_links():
+    events, impacts = _frames()
+    index = EventIndex(events)
+    assert index.duplicate_ids == ["E1"]
+    assert index.dangling(impacts)["record_id"].tolist() == ["L2"]
+    assert len(index.integrity_report(impacts)) == 2
+
+
+def test_calendar_matches_brute_force():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 40, 200).astype(float)
+    starts[::17] = np.nan
+    effects = rng.normal(size=200)
+    duration = 7.5
+    calendar = EventCalendar(starts, effects, duration, ids=np.arange(200))
+    times = np.concatenate([rng.uniform(-5, 60, 300), starts[:20], starts[:20] + duration])
+    times = times[~np.isnan(times)]
+
+    ok = ~np.isnan(starts)
+    for t, total, count in zip(times, calendar.cumulative_effect(times), calendar.active_counts(times)):
+        ramp = np.clip((t - starts[ok]) / duration, 0, 1)
+        assert np.isclose(total, (effects[ok] * ramp).sum())
+        ramping = ok & (starts <= t) & (t < starts + duration)
+        assert count == ramping.sum()
+        assert sorted(calendar.active(t)) == sorted(np.flatnonzero(ramping))
+        assert sorted(calendar.started(t)) == sorted(np.flatnonzero(ok & (starts <= t)))
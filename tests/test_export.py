@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+from src.export import export_csv, export_workbook
+
+
+def _frame(n=50):
+    return pd.DataFrame({
+        "record_id": [f"REC_{i:04d}" for i in range(n)],
+        "value_numeric": np.where(np.arange(n) % 4 == 0, np.nan, np.arange(n) * 1.5),
+        "count": np.arange(n),
+        "observation_date": pd.date_range("2020-01-01", periods=n, freq="MS"),
+        "notes": [None if i % 3 else f"note {i}" for i in range(n)],
+    })
+
+
+def test_export_csv_matches_to_csv_in_small_chunks(tmp_path):
+    df = _frame()
+    for frame in (df, df.iloc[:0]):
+        path = tmp_path / "out.csv"
+        stats = export_csv(frame, path, chunksize=3, workers=4)
+        assert path.read_bytes() == frame.to_csv(index=False).encode("utf-8")
+        assert stats["rows"] == len(frame)
+
+
+def test_export_workbook_round_trips_like_excel_writer(tmp_path):
+    sheets = {"data": _frame(), "events": _frame(7).drop(columns="count")}
+    path = tmp_path / "out.xlsx"
+    export_workbook(sheets, path, chunksize=3, workers=4)
+    reference = tmp_path / "reference.xlsx"
+    with pd.ExcelWriter(reference, engine="openpyxl") as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+    got = pd.read_excel(path, sheet_name=None)
+    expected = pd.read_excel(reference, sheet_name=None)
+    assert list(got) == list(sheets)
+    for name, df in sheets.items():
+        pd.testing.assert_frame_equal(got[name], expected[name])
+        pd.testing.assert_frame_equal(got[name], df, check_dtype=False)
@@ -0,0 +1,53 @@
+import numpy as np
+from src import forecasting
+from src.forecasting import (
+    _extract_series,
+    baseline_trend_forecast,
+    event_impact_additions,
+    joint_trend_forecast,
+    scenario_forecasts,
+)
+from src.impact_model import build_event_indicator_matrix, merge_event_impacts
+
+YEARS = [2025, 2027, 2030]
+
+
+def test_joint_forecast_full_catalogue_tracks_baseline(snapshot):
+    data, events, impact_links, index = snapshot
+    codes = sorted(data.loc[data["record_type"] == "observation", "indicator_code"].dropna().astype(str).unique())
+    joint, effects = joint_trend_forecast(data, codes, YEARS, events, impact_links, index=index)
+    assert np.isfinite(joint["forecast"]).all() and np.isfinite(effects).all()
+
+    exposure = build_event_indicator_matrix(merge_event_impacts(events, impact_links, index=index)).abs().sum()
+    for code in codes:
+        got = joint.loc[joint["indicator"] == code, "forecast"].to_numpy()
+        base = baseline_trend_forecast(data, code, YEARS)["forecast"].to_numpy()
+        n_obs = len(_extract_series(data, code)[0])
+        if exposure.get(code, 0) == 0:
+            # No events: the indicator's block is an independent OLS fit (flat for one observation)
+            np.testing.assert_allclose(got, base, rtol=1e-9, err_msg=code)
+        else:
+            # Events shift the trend by at most their prior magnitude (twice, allowing the slope to refit)
+            assert np.all(np.abs(got - base) <= 2 * exposure[code] + 1e-9), code
+        if n_obs == 1 and exposure.get(code, 0) == 0:
+            assert np.all(got == got[0]), code
+
+
+def test_scenario_forecasts_build_one_calendar(snapshot, monkeypatch):
+    data, events, impact_links, index = snapshot
+    built = []
+
+    class CountingCalendar(forecasting.EventCalendar):
+        def __init__(self, *args, **kwargs):
+            built.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(forecasting, "EventCalendar", CountingCalendar)
+    table = scenario_forecasts(data, "ACC_OWNERSHIP", YEARS, events, impact_links, index=index)
+    assert len(built) == 1
+
+    base_trend = baseline_trend_forecast(data, "ACC_OWNERSHIP", YEARS, confidence=0.68)["forecast"].to_numpy()
+    for scenario, scale, trend in [("pessimistic", 0.5, 0.95), ("base", 1.0, 1.0), ("optimistic", 1.5, 1.05)]:
+        additions = event_impact_additions(YEARS, events, impact_links, scale=scale, indicator_code="ACC_OWNERSHIP", index=index)
+        got = table.loc[table["scenario"] == scenario, "forecast"].to_numpy()
+        np.testing.assert_allclose(got, base_trend * trend + additions)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from src.forecasting import event_impact_additions
+from src.impact_model import apply_event_impacts_over_time, compute_numeric_impact, merge_event_impacts
+
+MAGNITUDES = {"low": 0.5, "medium": 1.5, "high": 3.0}
+DIRECTIONS = {"positive": 1, "increase": 1, "negative": -1, "decrease": -1}
+
+
+def _loop_additions(forecast_years, events, impact_links, scale, indicator_code):
+    """Reference: the per-link, per-year loop that EventCalendar replaced in event_impact_additions."""
+    links = impact_links
+    if indicator_code:
+        mask = links["indicator_code"] == indicator_code
+        if "related_indicator" in links:
+            mask |= links["related_indicator"] == indicator_code
+        if mask.any():
+            links = links[mask]
+    starts = events.drop_duplicates("record_id").set_index("record_id")["period_start"]
+    additions = np.zeros(len(forecast_years))
+    for _, row in links.iterrows():
+        start = pd.to_datetime(starts.get(row["parent_id"]))
+        if pd.isna(start):
+            continue
+        m = row["impact_magnitude"]
+        mag = 0.5 if pd.isna(m) else float(m) if isinstance(m, (int, float)) else MAGNITUDES.get(str(m).lower(), 0.5)
+        # Same sign rule as the implementation: directions are mapped to +/-1 before the text match
+        direction = DIRECTIONS.get(row["impact_direction"], row["impact_direction"])
+        sign = -1 if any(s in str(direction).lower() for s in ("neg", "dec")) else 1
+        lag = pd.to_numeric(row.get("lag_months"), errors="coerce")
+        start_year = start.year + int((0 if pd.isna(lag) else lag) // 12)
+        for i, y in enumerate(forecast_years):
+            if y >= start_year:
+                additions[i] += sign * mag * scale / 3.0 * min(y - start_year + 1, 3)
+    return additions
+
+
+def _loop_impact_over_time(dates, merged, duration_months):
+    """Reference: the per-date loop over effect starts that apply_event_impacts_over_time replaced."""
+    effects = merged.groupby(["period_start", "lag_months"])["impact_pp"].sum().reset_index()
+    totals = []
+    for obs_date in pd.to_datetime(dates):
+        total = 0.0
+        for _, row in effects.iterrows():
+            start = pd.to_datetime(row["period_start"]) + pd.DateOffset(months=int(row["lag_months"]))
+            months_elapsed = (obs_date - start).days / 30.44
+            if months_elapsed > 0:
+                total += row["impact_pp"] * min(months_elapsed / duration_months, 1.0)
+        totals.append(total)
+    return np.array(totals)
+
+
+def test_event_impact_additions_match_loop(processed):
+    data, events, impact_links = processed
+    years = list(range(2015, 2032))
+    for code in [None, "ACC_MM_ACCOUNT", "ACC_OWNERSHIP", "AFF_DATA_INCOME", "USG_P2P_COUNT"]:
+        got = event_impact_additions(years, events, impact_links, scale=1.3, indicator_code=code)
+        np.testing.assert_allclose(got, _loop_additions(years, events, impact_links, 1.3, code), err_msg=str(code))
+    # Fractional years count as the calendar year they fall in
+    np.testing.assert_allclose(
+        event_impact_additions([2023.25, 2023.75], events, impact_links),
+        event_impact_additions([2023, 2023], events, impact_links),
+    )
+
+
+def test_apply_event_impacts_over_time_matches_loop(processed):
+    data, events, impact_links = processed
+    merged = compute_numeric_impact(merge_event_impacts(events, impact_links))
+    merged["period_start"] = pd.to_datetime(merged["period_start"], errors="coerce")
+    merged["lag_months"] = pd.to_numeric(merged["lag_months"], errors="coerce").fillna(0)
+    for code in ["ACC_MM_ACCOUNT", "ACC_OWNERSHIP", "USG_P2P_COUNT", "ACC_FAYDA"]:
+        ind = data[data["indicator_code"] == code]
+        links = merged[merged["indicator_code"] == code]
+        for duration in (36, 12):
+            got = apply_event_impacts_over_time(ind, merged, duration_months=duration)
+            expected = _loop_impact_over_time(got["observation_date"], links, duration)
+            np.testing.assert_allclose(got["impact_addition"], expected, err_msg=code)
+    dense = pd.DataFrame({"observation_date": pd.date_range("2019-01-01", "2030-01-01", freq="17D"), "value_numeric": 1.0})
+    got = apply_event_impacts_over_time(dense, merged)
+    expected = _loop_impact_over_time(dense["observation_date"], merged.dropna(subset=["indicator_code"]), 36)
+    np.testing.assert_allclose(got["impact_addition"], expected)
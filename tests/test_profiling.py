@@ -0,0 +1,36 @@
+import pandas as pd
+from pathlib import Path
+from src.data_loading import load_unified_dataset
+from src.profiling import profile_dataset, profile_to_json, profile_to_markdown
+
+RAW = Path(__file__).resolve().parent.parent / "data" / "raw" / "ethiopia_fi_unified_data.xlsx"
+
+
+def test_links_without_parent_are_all_reported(tmp_path):
+    path = tmp_path / "links.csv"
+    pd.DataFrame({
+        "record_id": ["E1", "L1", "L2", "L3"],
+        "record_type": ["event", "impact_link", "impact_link", "impact_link"],
+        "parent_id": [None, None, None, "E9"],
+    }).to_csv(path, index=False)
+    profile = profile_dataset(str(path), chunksize=2)
+    assert profile["impact_links_without_parent_id"] == ["L1", "L2"]
+    assert profile["orphan_impact_links"] == {"E9": ["L3"]}
+    assert "impact_links without parent_id: 2" in profile_to_markdown(profile)
+
+
+def test_profile_matches_full_load():
+    profile = profile_dataset(str(RAW), chunksize=7)
+    df = load_unified_dataset(str(RAW))
+    assert profile["rows"] == len(df)
+    expected = df.isna().mean().mul(100).round(2).to_dict()
+    assert profile["missing_pct"] == expected
+    assert profile["duplicate_record_ids"] == {}
+    assert profile["orphan_impact_links"] == {}
+
+
+def test_report_layout_does_not_depend_on_chunking():
+    small = profile_dataset(str(RAW), chunksize=5)
+    default = profile_dataset(str(RAW))
+    assert profile_to_json(small) == profile_to_json(default)
+    assert profile_to_markdown(small) == profile_to_markdown(default)
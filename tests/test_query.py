@@ -0,0 +1,38 @@
+import pytest
+from pathlib import Path
+from src.data_loading import load_unified_dataset
+from src.query import scan, data_quality_report
+
+RAW = Path(__file__).resolve().parent.parent / "data" / "raw" / "ethiopia_fi_unified_data.xlsx"
+
+
+def test_select_then_groupby_agg_reads_group_and_agg_columns():
+    out = scan(RAW).select("indicator_code").groupby("pillar").agg(n=("value_numeric", "count")).collect()
+    df = load_unified_dataset(str(RAW))
+    expected = df.groupby("pillar")["value_numeric"].count()
+    assert out["n"].to_dict() == expected.to_dict()
+
+
+def test_groupby_without_agg_raises():
+    with pytest.raises(ValueError):
+        scan(RAW).groupby("record_type").collect()
+
+
+def test_filter_is_pushed_down_and_reapplied():
+    events = scan(RAW).filter("record_type", "==", "event").select("record_id").collect()
+    assert len(events) == 10
+    assert list(events.columns) == ["record_id"]
+
+
+def test_quality_report_matches_full_load():
+    report = data_quality_report(RAW)
+    df = load_unified_dataset(str(RAW))
+    assert report["record_type_counts"].to_dict() == df["record_type"].value_counts().to_dict()
+    assert report["missing_values"].round(6).to_dict() == df.isna().mean().mul(100).round(6).to_dict()
+
+
+def test_filter_without_matches_returns_empty_frame():
+    out = scan(RAW).filter("record_type", "==", "zzz").collect()
+    assert out.empty
+    assert list(out.columns) == list(load_unified_dataset(str(RAW)).columns)
+    assert scan(RAW).filter("record_type", "==", "zzz").pipe(len).collect() == 0